@@ -1,8 +1,11 @@
 import sys
 import os
+import re
 import cv2
 import json
+import threading
 import numpy as np
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from PyQt5.QtWidgets import (
@@ -11,12 +14,15 @@ from PyQt5.QtWidgets import (
     QGraphicsDropShadowEffect, QListWidget, QListWidgetItem, QMessageBox
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QRect
-from PyQt5.QtGui import QImage, QPixmap, QFont, QColor
+from PyQt5.QtGui import QImage, QPixmap, QFont, QColor, QTransform
 from pose_detector import PoseDetector
 from pose_comparator import compare_pose, PoseComparator
 from voice_feedback import VoiceFeedback
 from utils.image_overlay import draw_feedback_overlay, make_contact_sheet
 
+# Captured attempt images saved by PoseStepScreen: pose{N}_attempt{M}.jpg
+ATTEMPT_IMAGE_RE = re.compile(r"pose(\d+)_attempt(\d+)\.jpg")
+
 
 # Stylesheet with Apple-style gradient and card design
 APPLE_STYLESHEET = """
@@ -146,31 +152,119 @@ QListWidget::item:selected {
 
 
 class VideoThread(QThread):
-    """Thread for capturing live video from webcam"""
+    """Thread for capturing live video from webcam
+
+    Frames are emitted unmirrored; the preview mirrors them while scaling
+    and captures are mirrored once when taken. Cameras that ignore the
+    requested resolution are downscaled in this thread, uniformly so the
+    aspect ratio is kept, to fit within frame_size.
+    """
     change_pixmap_signal = pyqtSignal(np.ndarray)
 
-    def __init__(self):
+    def __init__(self, frame_size=(640, 480)):
         super().__init__()
         self._run_flag = True
+        self.frame_size = frame_size
+        # Set while the UI is ready for another frame; frames grabbed while
+        # it is clear are dropped without being decoded
+        self._consumer_ready = threading.Event()
+        self._consumer_ready.set()
 
     def run(self):
+        width, height = self.frame_size
         cap = cv2.VideoCapture(0)
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+
+        # Two reused decode and resize targets: the UI keeps a reference to
+        # the last emitted frame while the next one is written into the other
+        # buffer. Both are sized from the first frame that needs them.
+        retrieve_bufs = [None, None]
+        resize_bufs = [None, None]
+        buf_idx = 0
+
+        # Bind per-frame lookups to locals once, outside the capture loop
+        grab = cap.grab
+        retrieve = cap.retrieve
+        consumer_ready = self._consumer_ready.is_set
+        mark_pending = self._consumer_ready.clear
+        emit = self.change_pixmap_signal.emit
 
         while self._run_flag:
-            ret, frame = cap.read()
+            # Always grab to keep the driver buffer fresh, but only decode
+            # frames the UI will actually display
+            if not grab() or not consumer_ready():
+                continue
+            ret, frame = retrieve(retrieve_bufs[buf_idx])
             if ret:
-                frame = cv2.flip(frame, 1)
-                self.change_pixmap_signal.emit(frame)
+                retrieve_bufs[buf_idx] = frame
+                # Scale both axes by the same factor so a 16:9 camera is not
+                # squashed to 4:3, which would skew landmarks and joint angles
+                frame_h, frame_w = frame.shape[:2]
+                scale = min(width / frame_w, height / frame_h)
+                if scale < 1:
+                    small_shape = (round(frame_h * scale), round(frame_w * scale), 3)
+                    if resize_bufs[buf_idx] is None or resize_bufs[buf_idx].shape != small_shape:
+                        resize_bufs[buf_idx] = np.empty(small_shape, dtype=np.uint8)
+                    frame = cv2.resize(frame, small_shape[1::-1], dst=resize_bufs[buf_idx],
+                                       interpolation=cv2.INTER_AREA)
+                buf_idx ^= 1
+                mark_pending()
+                emit(frame)
 
         cap.release()
 
+    def frame_consumed(self):
+        """Mark the last emitted frame as displayed so the next one is decoded"""
+        self._consumer_ready.set()
+
     def stop(self):
         self._run_flag = False
         self.wait()
 
 
+class PoseAnalysisThread(QThread):
+    """Thread for running pose detection and comparison on a captured frame
+
+    Keeps MediaPipe inference off the GUI thread so the live preview keeps
+    updating while a capture is analyzed. Emits the comparison result (None
+    when no pose was found in the capture) and the reference landmarks, which
+    are only detected when ref_landmarks is not given. When save_path is set,
+    the capture is also written there as a JPEG before analysis.
+    """
+    analysis_done = pyqtSignal(object, object)
+
+    def __init__(self, pose_detector, image, ref_path, joints_config, ref_landmarks=None,
+                 save_path=None):
+        super().__init__()
+        self.pose_detector = pose_detector
+        self.image = image
+        self.ref_path = ref_path
+        self.joints_config = joints_config
+        self.ref_landmarks = ref_landmarks
+        self.save_path = save_path
+
+    def run(self):
+        # JPEG encoding and disk I/O stay off the GUI thread too
+        if self.save_path is not None:
+            cv2.imwrite(str(self.save_path), self.image)
+
+        # Load reference landmarks on the first analysis only. They are cached
+        # for every retry, so detect them before the user capture can
+        # influence the detector.
+        ref_lm = self.ref_landmarks
+        if ref_lm is None:
+            ref_img = cv2.imread(self.ref_path)
+            ref_lm = self.pose_detector.get_landmarks(ref_img)
+
+        user_lm = self.pose_detector.get_landmarks(self.image)
+        if user_lm is None:
+            self.analysis_done.emit(None, ref_lm)
+            return
+
+        self.analysis_done.emit(compare_pose(user_lm, ref_lm, self.joints_config), ref_lm)
+
+
 class WelcomeScreen(QWidget):
     """Welcome screen with hero gradient and start button"""
     start_session_signal = pyqtSignal(list, bool)
@@ -255,13 +349,20 @@ class PoseStepScreen(QWidget):
     next_pose_signal = pyqtSignal()
     retry_pose_signal = pyqtSignal()
 
-    def __init__(self, pose_data, pose_idx, voice_enabled):
+    def __init__(self, pose_data, pose_idx, voice_enabled, pose_detector, voice=None):
         super().__init__()
         self.pose_data = pose_data
         self.pose_idx = pose_idx
         self.voice_enabled = voice_enabled
-        self.pose_detector = PoseDetector()
+        self.pose_detector = pose_detector
+        self.voice = voice
         self.video_thread = None
+        self.analysis_thread = None
+        # Reference pose landmarks, detected once on the first capture
+        self.ref_landmarks = None
+        # Joint config for this pose, resolved once instead of on every capture
+        self.joints_config = PoseComparator.POSE_KEY_ANGLES.get(
+            pose_data["name"], PoseComparator.POSE_KEY_ANGLES['Front Double Biceps'])
         self.countdown_timer = QTimer()
         self.countdown_value = 5
         self.current_frame = None
@@ -398,19 +499,28 @@ class PoseStepScreen(QWidget):
     def update_camera(self, frame):
         """Update camera display"""
         self.current_frame = frame
-        self.display_image(frame, self.camera_label)
+        self.display_image(frame, self.camera_label, mirror=True)
+        if self.video_thread:
+            self.video_thread.frame_consumed()
 
-    def display_image(self, cv_img, label):
-        """Display OpenCV image in QLabel without stretching"""
+    def display_image(self, cv_img, label, mirror=False):
+        """Display OpenCV image in QLabel without stretching, optionally mirrored"""
         if cv_img is None:
             return
         height, width, channel = cv_img.shape
         bytes_per_line = 3 * width
-        q_image = QImage(cv_img.data, width, height, bytes_per_line, QImage.Format_RGB888).rgbSwapped()
+        # OpenCV frames are BGR; let Qt read them as-is instead of swapping a copy
+        q_image = QImage(cv_img.data, width, height, bytes_per_line, QImage.Format_BGR888)
         pixmap = QPixmap.fromImage(q_image)
         # Scale keeping aspect ratio instead of stretching
         label.setScaledContents(False)
-        label.setPixmap(pixmap.scaled(label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        if mirror:
+            # Mirror as part of the scaling pass instead of flipping every frame
+            target = pixmap.size().scaled(label.size(), Qt.KeepAspectRatio)
+            transform = QTransform.fromScale(-target.width() / width, target.height() / height)
+            label.setPixmap(pixmap.transformed(transform, Qt.SmoothTransformation))
+        else:
+            label.setPixmap(pixmap.scaled(label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
 
     def start_countdown(self):
         """Begin 5-second countdown"""
@@ -446,30 +556,29 @@ class PoseStepScreen(QWidget):
         # Increment attempt count
         self.attempt_count += 1
 
-        # Save with attempt number
+        # Mirror the capture once so it matches the preview the user posed against
+        self.captured_image = cv2.flip(self.current_frame, 1)
+
+        # Saved with attempt number by the analysis thread
         user_path = self.session_dir / f"pose{self.pose_idx+1}_attempt{self.attempt_count}.jpg"
-        cv2.imwrite(str(user_path), self.current_frame)
-        self.captured_image = self.current_frame.copy()
 
-        # Get landmarks
-        user_lm = self.pose_detector.get_landmarks(self.current_frame)
+        # Detect and compare in the background; results arrive in on_analysis_done
+        self.analysis_thread = PoseAnalysisThread(self.pose_detector, self.captured_image,
+                                                  self.pose_data["ref"], self.joints_config,
+                                                  self.ref_landmarks, user_path)
+        self.analysis_thread.analysis_done.connect(self.on_analysis_done)
+        self.analysis_thread.start()
 
-        # Load reference landmarks
-        ref_img = cv2.imread(self.pose_data["ref"])
-        ref_lm = self.pose_detector.get_landmarks(ref_img)
+    def on_analysis_done(self, result, ref_landmarks):
+        """Show comparison results for the last capture"""
+        self.ref_landmarks = ref_landmarks
 
-        if user_lm is None:
+        if result is None:
             QMessageBox.warning(self, "Detection Failed",
                               "Couldn't see full body. Try again with better lighting and full body in frame.")
             self.start_btn.setEnabled(True)
             return
 
-        # Get joint config for this pose
-        joints_config = PoseComparator.POSE_KEY_ANGLES.get(self.pose_data["name"],
-                                                           PoseComparator.POSE_KEY_ANGLES['Front Double Biceps'])
-
-        # Compare poses
-        result = compare_pose(user_lm, ref_lm, joints_config)
         self.feedback_result = result
 
         # Save feedback JSON
@@ -511,15 +620,12 @@ class PoseStepScreen(QWidget):
                 self.tips_list.addItem(f"• {tip}")
 
         # Voice feedback
-        if self.voice_enabled:
-            from voice_feedback import VoiceFeedback
-            voice = VoiceFeedback()
-
+        if self.voice_enabled and self.voice:
             # Provide context-aware feedback
             if score < self.required_score:
-                voice.speak_tips([f"Score {int(score)} percent. You need {int(self.required_score)} percent."] + result["top_tips"][:2])
+                self.voice.speak_tips([f"Score {int(score)} percent. You need {int(self.required_score)} percent."] + result["top_tips"][:2])
             else:
-                voice.speak_tips([f"Great job! Score {int(score)} percent. Moving to next level."])
+                self.voice.speak_tips([f"Great job! Score {int(score)} percent. Moving to next level."])
 
         # Check if score meets threshold
         if score >= self.required_score:
@@ -582,6 +688,17 @@ class SummaryScreen(QWidget):
 
         pose_names = ["Back Double Biceps", "Front Double Biceps", "Side Chest", "Back Lat Spread"]
 
+        # One directory scan finds the latest attempt image for every pose,
+        # instead of probing attempt1, attempt2, ... with a stat per name
+        latest_attempts = {}
+        with os.scandir(self.session_dir) as entries:
+            for entry in entries:
+                match = ATTEMPT_IMAGE_RE.fullmatch(entry.name)
+                if match:
+                    pose_num, attempt = int(match.group(1)), int(match.group(2))
+                    if attempt > latest_attempts.get(pose_num, (0, None))[0]:
+                        latest_attempts[pose_num] = (attempt, entry.path)
+
         for i in range(4):
             pose_card = QWidget()
             pose_card.setObjectName("Card")
@@ -595,24 +712,14 @@ class SummaryScreen(QWidget):
             img_label.setAlignment(Qt.AlignCenter)
             img_label.setStyleSheet("border: 1px solid #e2e8f0; border-radius: 8px;")
 
-            # Find the best attempt for this pose
-            img_path = None
-            attempt = 1
-            while True:
-                potential_path = self.session_dir / f"pose{i+1}_attempt{attempt}.jpg"
-                if potential_path.exists():
-                    img_path = potential_path
-                    attempt += 1
-                else:
-                    break
-
             # Use the last attempt (most recent/best) if any exist
-            if img_path and img_path.exists():
-                img = cv2.imread(str(img_path))
+            img_path = latest_attempts.get(i + 1, (0, None))[1]
+            if img_path is not None:
+                img = cv2.imread(img_path)
                 if img is not None:
                     h, w = img.shape[:2]
                     bytes_per_line = 3 * w
-                    q_image = QImage(img.data, w, h, bytes_per_line, QImage.Format_RGB888).rgbSwapped()
+                    q_image = QImage(img.data, w, h, bytes_per_line, QImage.Format_BGR888)
                     pixmap = QPixmap.fromImage(q_image)
                     img_label.setPixmap(pixmap.scaled(img_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
 
@@ -679,7 +786,6 @@ class SummaryScreen(QWidget):
             all_tips.extend(result.get("top_tips", []))
 
         # Count frequency and return top 3
-        from collections import Counter
         if all_tips:
             counter = Counter(all_tips)
             return [tip for tip, _ in counter.most_common(3)]
@@ -732,6 +838,11 @@ class PosePerfectApp(QMainWindow):
         self.session_dir = None
         self.session_results = []
 
+        # Shared by every pose step and session; created on first use since
+        # loading the pose model and the TTS engine is slow
+        self.pose_detector = None
+        self.voice = None
+
         # Create welcome screen
         self.welcome_screen = WelcomeScreen()
         self.welcome_screen.start_session_signal.connect(self.start_session)
@@ -751,10 +862,18 @@ class PosePerfectApp(QMainWindow):
         self.session_dir = Path("static") / f"session_{timestamp}"
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
+        # Only still captures and reference images are analyzed, so the
+        # shared detector must not track landmarks from one image to the next
+        if self.pose_detector is None:
+            self.pose_detector = PoseDetector(static_image_mode=True)
+        if self.voice_enabled and self.voice is None:
+            self.voice = VoiceFeedback()
+
         # Create pose step screens
         self.pose_step_screens = []
         for i, pose_data in enumerate(self.pose_sequence):
-            step_screen = PoseStepScreen(pose_data, i, self.voice_enabled)
+            step_screen = PoseStepScreen(pose_data, i, self.voice_enabled,
+                                         self.pose_detector, self.voice)
             step_screen.set_session_dir(self.session_dir)
             step_screen.next_pose_signal.connect(self.next_pose)
             step_screen.retry_pose_signal.connect(self.retry_pose)
@@ -827,6 +946,11 @@ class PosePerfectApp(QMainWindow):
 
 
 def main():
+    # Keep OpenCV's per-frame work (resize, colour conversion) on the calling
+    # thread so its worker pool doesn't compete with capture, MediaPipe and Qt
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(1)
+
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     app.setStyleSheet(APPLE_STYLESHEET)
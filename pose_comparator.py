@@ -1,6 +1,85 @@
-import numpy as np
 import math
-from typing import Dict, List, Optional
+import numpy as np
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+# MediaPipe pose landmark indices
+_POSE_LANDMARKS = {
+    'nose': 0,
+    'left_eye': 2,
+    'right_eye': 5,
+    'left_ear': 7,
+    'right_ear': 8,
+    'left_shoulder': 11,
+    'right_shoulder': 12,
+    'left_elbow': 13,
+    'right_elbow': 14,
+    'left_wrist': 15,
+    'right_wrist': 16,
+    'left_hip': 23,
+    'right_hip': 24,
+    'left_knee': 25,
+    'right_knee': 26,
+    'left_ankle': 27,
+    'right_ankle': 28
+}
+
+# Key angles for each bodybuilding pose
+_POSE_KEY_ANGLES = {
+    'Front Double Biceps': (
+        ('left_shoulder', 'left_elbow', 'left_wrist'),
+        ('right_shoulder', 'right_elbow', 'right_wrist'),
+        ('left_hip', 'left_shoulder', 'left_elbow'),
+        ('right_hip', 'right_shoulder', 'right_elbow')
+    ),
+    'Side Chest': (
+        ('left_shoulder', 'left_elbow', 'left_wrist'),
+        ('left_hip', 'left_shoulder', 'left_elbow'),
+        ('left_hip', 'left_knee', 'left_ankle')
+    ),
+    'Back Lat Spread': (
+        ('left_shoulder', 'left_elbow', 'left_wrist'),
+        ('right_shoulder', 'right_elbow', 'right_wrist'),
+        ('left_hip', 'left_shoulder', 'left_elbow'),
+        ('right_hip', 'right_shoulder', 'right_elbow')
+    ),
+    'Rear Double Biceps': (
+        ('left_shoulder', 'left_elbow', 'left_wrist'),
+        ('right_shoulder', 'right_elbow', 'right_wrist'),
+        ('left_hip', 'left_knee', 'left_ankle'),
+        ('right_hip', 'right_knee', 'right_ankle')
+    )
+}
+
+# Corrections suggested when alignment with a pose falls below 70%
+_POSE_ALIGNMENT_TIPS = {
+    'Front Double Biceps': ("Raise arms to shoulder level", "Flex biceps harder"),
+    'Side Chest': ("Turn torso more to the side", "Bring front arm across chest"),
+    'Back Lat Spread': ("Spread lats wider", "Keep elbows forward"),
+    'Rear Double Biceps': ("Flex calves", "Squeeze shoulder blades together")
+}
+
+# Left/right arm and leg triplets compared by PoseComparator.calculate_symmetry
+_SYMMETRY_TRIPLETS = np.array([
+    [_POSE_LANDMARKS['left_shoulder'], _POSE_LANDMARKS['left_elbow'], _POSE_LANDMARKS['left_wrist']],
+    [_POSE_LANDMARKS['right_shoulder'], _POSE_LANDMARKS['right_elbow'], _POSE_LANDMARKS['right_wrist']],
+    [_POSE_LANDMARKS['left_hip'], _POSE_LANDMARKS['left_knee'], _POSE_LANDMARKS['left_ankle']],
+    [_POSE_LANDMARKS['right_hip'], _POSE_LANDMARKS['right_knee'], _POSE_LANDMARKS['right_ankle']]
+])
+
+# Shoulder landmarks compared for level shoulders in symmetry scoring
+_LEFT_SHOULDER = _POSE_LANDMARKS['left_shoulder']
+_RIGHT_SHOULDER = _POSE_LANDMARKS['right_shoulder']
+
+
+class JointAngleComparison(NamedTuple):
+    """Batched joint angles for a live and a reference pose"""
+    live_points: np.ndarray   # (N, 2) live landmark x, y coordinates
+    triplets: np.ndarray      # (K, 3) landmark indices, angle at the middle one
+    live_angles: np.ndarray   # (K,) live joint angles in degrees
+    ref_angles: np.ndarray    # (K,) reference joint angles in degrees
+    symmetry: float           # live pose symmetry score, 0-100
 
 
 def compare_pose(user_landmarks, ref_landmarks, joints_config=None) -> dict:
@@ -16,7 +95,7 @@ def compare_pose(user_landmarks, ref_landmarks, joints_config=None) -> dict:
         "top_tips": [ "Open lats", "Straighten wrists", ... ]
       }
     """
-    if not user_landmarks or not ref_landmarks:
+    if not _has_landmarks(user_landmarks) or not _has_landmarks(ref_landmarks):
         return {
             "score": 0,
             "per_joint": {},
@@ -27,39 +106,24 @@ def compare_pose(user_landmarks, ref_landmarks, joints_config=None) -> dict:
 
     # Use default joints config if not provided
     if joints_config is None:
-        joints_config = PoseComparator.POSE_KEY_ANGLES.get('Front Double Biceps', [])
+        joints_config = _POSE_KEY_ANGLES.get('Front Double Biceps', ())
 
     per_joint = {}
-    angle_differences = []
     tips = []
 
-    # Calculate joint angle differences
-    for angle_joints in joints_config:
-        joint1_idx = PoseComparator.POSE_LANDMARKS[angle_joints[0]]
-        joint2_idx = PoseComparator.POSE_LANDMARKS[angle_joints[1]]
-        joint3_idx = PoseComparator.POSE_LANDMARKS[angle_joints[2]]
-
-        user_angle = PoseComparator.calculate_angle(
-            user_landmarks[joint1_idx],
-            user_landmarks[joint2_idx],
-            user_landmarks[joint3_idx]
-        )
-
-        ref_angle = PoseComparator.calculate_angle(
-            ref_landmarks[joint1_idx],
-            ref_landmarks[joint2_idx],
-            ref_landmarks[joint3_idx]
-        )
-
-        delta = user_angle - ref_angle
-        angle_differences.append(abs(delta))
+    # Calculate joint angle differences for all joints in one batch
+    comparison = PoseComparator.compare_joint_angles(user_landmarks, ref_landmarks, joints_config)
+    symmetry = comparison.symmetry
+    deltas = comparison.live_angles - comparison.ref_angles
+    angle_differences = np.abs(deltas)
 
+    for angle_joints, delta in zip(joints_config, deltas):
         # Generate advice for this joint
         joint_name = angle_joints[1]
         advice = _generate_joint_advice(joint_name, delta)
 
         per_joint[joint_name] = {
-            "delta_deg": round(delta, 1),
+            "delta_deg": round(float(delta), 1),
             "advice": advice
         }
 
@@ -68,8 +132,7 @@ def compare_pose(user_landmarks, ref_landmarks, joints_config=None) -> dict:
             tips.append(advice)
 
     # Calculate scores
-    alignment = max(0, 100 - np.mean(angle_differences) * 2)
-    symmetry = PoseComparator.calculate_symmetry(user_landmarks)
+    alignment = max(0, 100 - float(angle_differences.mean()) * 2)
     overall_score = (alignment * 0.7 + symmetry * 0.3)
 
     # Add symmetry tip if needed
@@ -88,6 +151,49 @@ def compare_pose(user_landmarks, ref_landmarks, joints_config=None) -> dict:
     }
 
 
+@lru_cache(maxsize=None)
+def _joint_triplets(joints_config: Tuple[Tuple[str, str, str], ...]) -> np.ndarray:
+    """Resolve joint name triplets to a read-only (K, 3) landmark index array, once per config"""
+    triplets = np.array([[_POSE_LANDMARKS[name] for name in angle_joints]
+                         for angle_joints in joints_config], dtype=np.intp).reshape(-1, 3)
+    triplets.setflags(write=False)
+    return triplets
+
+
+@lru_cache(maxsize=None)
+def _joint_triplets_with_symmetry(joints_config: Tuple[Tuple[str, str, str], ...]) -> np.ndarray:
+    """Key joint triplets followed by _SYMMETRY_TRIPLETS, for one fused angle batch"""
+    triplets = np.vstack([_joint_triplets(joints_config), _SYMMETRY_TRIPLETS])
+    triplets.setflags(write=False)
+    return triplets
+
+
+def _has_landmarks(landmarks) -> bool:
+    """Check for a non-empty landmark list or array"""
+    return landmarks is not None and len(landmarks) > 0
+
+
+def _point_xy(point) -> Tuple[float, float]:
+    """Get the x, y coordinates of a landmark dict or landmark array row"""
+    if isinstance(point, dict):
+        return point['x'], point['y']
+    return float(point[0]), float(point[1])
+
+
+# Advice verbs per joint type: (user angle too large, user angle too small)
+_JOINT_ADVICE_ACTIONS = {
+    # For elbows and knees, positive delta means more bent
+    'elbow': ("Straighten", "Bend"),
+    'knee': ("Straighten", "Bend"),
+    # For shoulders/hips, direction depends on context
+    'shoulder': ("Lower", "Raise"),
+    'hip': ("Lower", "Raise"),
+    'wrist': ("Adjust down", "Adjust up"),
+    'ankle': ("Adjust down", "Adjust up")
+}
+_DEFAULT_ADVICE_ACTIONS = ("Adjust", "Adjust")
+
+
 def _generate_joint_advice(joint_name: str, delta_deg: float) -> str:
     """
     Generate specific advice for a joint based on angle delta.
@@ -102,31 +208,15 @@ def _generate_joint_advice(joint_name: str, delta_deg: float) -> str:
     # Round to nearest 5 degrees for cleaner advice
     delta_rounded = int(round(abs(delta_deg) / 5) * 5)
 
-    if abs(delta_deg) < 5:
-        return f"Perfect {joint_name.replace('_', ' ')}"
-
     joint_display = joint_name.replace('_', ' ')
 
-    # Determine direction based on joint type and delta sign
-    if 'elbow' in joint_name or 'knee' in joint_name:
-        # For elbows and knees, positive delta means more bent
-        if delta_deg > 0:
-            action = "Straighten"
-        else:
-            action = "Bend"
-    elif 'shoulder' in joint_name or 'hip' in joint_name:
-        # For shoulders/hips, direction depends on context
-        if delta_deg > 0:
-            action = "Lower"
-        else:
-            action = "Raise"
-    elif 'wrist' in joint_name or 'ankle' in joint_name:
-        if delta_deg > 0:
-            action = "Adjust down"
-        else:
-            action = "Adjust up"
-    else:
-        action = "Adjust"
+    if abs(delta_deg) < 5:
+        return f"Perfect {joint_display}"
+
+    # Pick direction from the joint type and delta sign
+    increase_action, decrease_action = _JOINT_ADVICE_ACTIONS.get(
+        joint_name.rpartition('_')[2], _DEFAULT_ADVICE_ACTIONS)
+    action = increase_action if delta_deg > 0 else decrease_action
 
     return f"{action} {joint_display} {delta_rounded}°"
 
@@ -134,113 +224,161 @@ def _generate_joint_advice(joint_name: str, delta_deg: float) -> str:
 class PoseComparator:
     """Compare live poses with reference poses for bodybuilding training"""
     
-    # MediaPipe pose landmark indices
-    POSE_LANDMARKS = {
-        'nose': 0,
-        'left_eye': 2,
-        'right_eye': 5,
-        'left_ear': 7,
-        'right_ear': 8,
-        'left_shoulder': 11,
-        'right_shoulder': 12,
-        'left_elbow': 13,
-        'right_elbow': 14,
-        'left_wrist': 15,
-        'right_wrist': 16,
-        'left_hip': 23,
-        'right_hip': 24,
-        'left_knee': 25,
-        'right_knee': 26,
-        'left_ankle': 27,
-        'right_ankle': 28
-    }
-    
-    # Key angles for each bodybuilding pose
-    POSE_KEY_ANGLES = {
-        'Front Double Biceps': [
-            ('left_shoulder', 'left_elbow', 'left_wrist'),
-            ('right_shoulder', 'right_elbow', 'right_wrist'),
-            ('left_hip', 'left_shoulder', 'left_elbow'),
-            ('right_hip', 'right_shoulder', 'right_elbow')
-        ],
-        'Side Chest': [
-            ('left_shoulder', 'left_elbow', 'left_wrist'),
-            ('left_hip', 'left_shoulder', 'left_elbow'),
-            ('left_hip', 'left_knee', 'left_ankle')
-        ],
-        'Back Lat Spread': [
-            ('left_shoulder', 'left_elbow', 'left_wrist'),
-            ('right_shoulder', 'right_elbow', 'right_wrist'),
-            ('left_hip', 'left_shoulder', 'left_elbow'),
-            ('right_hip', 'right_shoulder', 'right_elbow')
-        ],
-        'Rear Double Biceps': [
-            ('left_shoulder', 'left_elbow', 'left_wrist'),
-            ('right_shoulder', 'right_elbow', 'right_wrist'),
-            ('left_hip', 'left_knee', 'left_ankle'),
-            ('right_hip', 'right_knee', 'right_ankle')
-        ]
-    }
+    # Module-level tables, exposed on the class for existing callers
+    POSE_LANDMARKS = _POSE_LANDMARKS
+    POSE_KEY_ANGLES = _POSE_KEY_ANGLES
+    POSE_ALIGNMENT_TIPS = _POSE_ALIGNMENT_TIPS
+    SYMMETRY_TRIPLETS = _SYMMETRY_TRIPLETS
     
     @staticmethod
     def calculate_angle(point1, point2, point3):
-        """Calculate angle between three points"""
-        v1 = np.array([point1['x'] - point2['x'], point1['y'] - point2['y']])
-        v2 = np.array([point3['x'] - point2['x'], point3['y'] - point2['y']])
+        """Calculate angle between three points (landmark dicts or array rows)"""
+        # Plain float math: NumPy calls on 2-element vectors cost more in
+        # dispatch overhead than the arithmetic itself
+        x1, y1 = _point_xy(point1)
+        x2, y2 = _point_xy(point2)
+        x3, y3 = _point_xy(point3)
+        v1x, v1y = x1 - x2, y1 - y2
+        v2x, v2y = x3 - x2, y3 - y2
         
-        cosine_angle = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2) + 1e-6)
-        angle = np.arccos(np.clip(cosine_angle, -1.0, 1.0))
+        # atan2(|cross|, dot) needs no norms or clamping and stays accurate
+        # for nearly straight or fully folded limbs, where acos does not
+        cross = v1x * v2y - v1y * v2x
+        dot = v1x * v2x + v1y * v2y
         
-        return np.degrees(angle)
+        return math.degrees(math.atan2(abs(cross), dot))
+    
+    @staticmethod
+    def landmarks_to_pack(landmarks):
+        """
+        Get landmarks as a single (N, 4) array, whichever form they come in.
+
+        Args:
+            landmarks: (N, 4) landmark array from PoseDetector, or a list of
+                       landmark dicts with x, y and optional z, visibility keys
+
+        Returns:
+            (N, 4) float32 array of x, y, z, visibility per landmark; dicts
+            without z or visibility get 0 and 1
+        """
+        if isinstance(landmarks, np.ndarray):
+            return landmarks
+        return np.array([(lm['x'], lm['y'], lm.get('z', 0.0), lm.get('visibility', 1.0))
+                         for lm in landmarks], dtype=np.float32).reshape(-1, 4)
+
+    @staticmethod
+    def landmarks_to_array(landmarks):
+        """
+        Get landmark x, y coordinates as a single array.
+
+        MediaPipe reports landmarks in single precision, so float32 holds
+        them exactly at half the size of the float64 default.
+
+        Args:
+            landmarks: (N, 4) landmark array from PoseDetector, or a list of
+                       landmark dicts with x, y keys
+
+        Returns:
+            (N, 2) float32 array of landmark x, y coordinates
+        """
+        return PoseComparator.landmarks_to_pack(landmarks)[:, :2]
+    
+    @staticmethod
+    def calculate_angles(points, triplets):
+        """
+        Calculate the angle at the middle point of every index triplet in one batch.
+
+        Args:
+            points: (N, 2) array of landmark x, y coordinates
+            triplets: (K, 3) integer array of landmark indices (a, b, c), angle at b
+
+        Returns:
+            (K,) array of angles in degrees
+        """
+        pts = points[triplets]
+        v1 = pts[:, 0] - pts[:, 1]
+        v2 = pts[:, 2] - pts[:, 1]
+        
+        cross = v1[:, 0] * v2[:, 1] - v1[:, 1] * v2[:, 0]
+        dot = v1[:, 0] * v2[:, 0] + v1[:, 1] * v2[:, 1]
+        
+        return np.degrees(np.arctan2(np.abs(cross), dot))
+    
+    @staticmethod
+    def compare_joint_angles(live_landmarks, reference_landmarks, joints_config):
+        """
+        Calculate live and reference angles for every key joint in one batch.
+
+        Args:
+            live_landmarks: Landmarks of the pose being scored
+            reference_landmarks: Landmarks of the reference pose
+            joints_config: Sequence of (joint1, joint2, joint3) name triplets, angle at joint2
+
+        Returns:
+            JointAngleComparison with the live coordinates, the landmark index
+            triplets, both angle arrays and the live pose symmetry score
+        """
+        # Hashable key for the cached lookups; the inner triplets may be lists
+        joints_config = tuple(map(tuple, joints_config))
+        triplets = _joint_triplets(joints_config)
+        live_points = PoseComparator.landmarks_to_array(live_landmarks)
+        ref_points = PoseComparator.landmarks_to_array(reference_landmarks)
+        
+        # The symmetry angles ride along in the live batch instead of being
+        # computed again by calculate_symmetry
+        live_angles = PoseComparator.calculate_angles(live_points, _joint_triplets_with_symmetry(joints_config))
+        key_count = len(triplets)
+        symmetry = PoseComparator.symmetry_from_angles(live_points, live_angles[key_count:])
+        
+        return JointAngleComparison(live_points, triplets, live_angles[:key_count],
+                                    PoseComparator.calculate_angles(ref_points, triplets), symmetry)
     
     @staticmethod
     def calculate_symmetry(landmarks):
         """Calculate body symmetry score"""
-        if not landmarks:
+        if not _has_landmarks(landmarks):
             return 0
         
-        symmetry_scores = []
+        # Arm and leg angles for both sides in a single batch
+        points = PoseComparator.landmarks_to_array(landmarks)
+        return PoseComparator.symmetry_from_angles(
+            points, PoseComparator.calculate_angles(points, _SYMMETRY_TRIPLETS))
+    
+    @staticmethod
+    def symmetry_from_angles(points, symmetry_angles):
+        """
+        Calculate body symmetry score from precomputed limb angles.
+
+        Args:
+            points: (N, 2) array of landmark x, y coordinates
+            symmetry_angles: Angles for SYMMETRY_TRIPLETS, in the same order
+
+        Returns:
+            Symmetry score from 0 to 100
+        """
+        left_arm_angle, right_arm_angle, left_leg_angle, right_leg_angle = symmetry_angles.tolist()
         
         # Compare arm positions
-        left_arm_angle = PoseComparator.calculate_angle(
-            landmarks[PoseComparator.POSE_LANDMARKS['left_shoulder']],
-            landmarks[PoseComparator.POSE_LANDMARKS['left_elbow']],
-            landmarks[PoseComparator.POSE_LANDMARKS['left_wrist']]
-        )
-        right_arm_angle = PoseComparator.calculate_angle(
-            landmarks[PoseComparator.POSE_LANDMARKS['right_shoulder']],
-            landmarks[PoseComparator.POSE_LANDMARKS['right_elbow']],
-            landmarks[PoseComparator.POSE_LANDMARKS['right_wrist']]
-        )
         arm_symmetry = max(0, 100 - abs(left_arm_angle - right_arm_angle))
-        symmetry_scores.append(arm_symmetry)
         
         # Compare leg positions
-        left_leg_angle = PoseComparator.calculate_angle(
-            landmarks[PoseComparator.POSE_LANDMARKS['left_hip']],
-            landmarks[PoseComparator.POSE_LANDMARKS['left_knee']],
-            landmarks[PoseComparator.POSE_LANDMARKS['left_ankle']]
-        )
-        right_leg_angle = PoseComparator.calculate_angle(
-            landmarks[PoseComparator.POSE_LANDMARKS['right_hip']],
-            landmarks[PoseComparator.POSE_LANDMARKS['right_knee']],
-            landmarks[PoseComparator.POSE_LANDMARKS['right_ankle']]
-        )
         leg_symmetry = max(0, 100 - abs(left_leg_angle - right_leg_angle))
-        symmetry_scores.append(leg_symmetry)
         
         # Compare shoulder heights
-        left_shoulder_y = landmarks[PoseComparator.POSE_LANDMARKS['left_shoulder']]['y']
-        right_shoulder_y = landmarks[PoseComparator.POSE_LANDMARKS['right_shoulder']]['y']
+        left_shoulder_y = float(points[_LEFT_SHOULDER, 1])
+        right_shoulder_y = float(points[_RIGHT_SHOULDER, 1])
         shoulder_symmetry = max(0, 100 - abs(left_shoulder_y - right_shoulder_y) * 500)
-        symmetry_scores.append(shoulder_symmetry)
         
-        return np.mean(symmetry_scores)
+        # Plain float mean of the three scores, no array round trip
+        return (arm_symmetry + leg_symmetry + shoulder_symmetry) / 3
     
     @staticmethod
-    def compare_poses(live_landmarks, reference_landmarks, pose_mode):
-        """Compare live pose with reference pose"""
-        if not live_landmarks or not reference_landmarks:
+    def compare_poses(live_landmarks, reference_landmarks, pose_mode, frame_size=(640, 480)):
+        """Compare live pose with reference pose
+
+        Joint error positions are scaled to frame_size, given as (width, height).
+        """
+        if not _has_landmarks(live_landmarks) or not _has_landmarks(reference_landmarks):
             return {
                 'overall_score': 0,
                 'symmetry_score': 0,
@@ -250,73 +388,43 @@ class PoseComparator:
             }
         
         # Get key angles for the specific pose
-        key_angles = PoseComparator.POSE_KEY_ANGLES.get(pose_mode, [])
-        angle_differences = []
+        key_angles = _POSE_KEY_ANGLES.get(pose_mode, ())
         joint_errors = []
         feedback = []
         
-        for angle_joints in key_angles:
-            # Get joint indices
-            joint1_idx = PoseComparator.POSE_LANDMARKS[angle_joints[0]]
-            joint2_idx = PoseComparator.POSE_LANDMARKS[angle_joints[1]]
-            joint3_idx = PoseComparator.POSE_LANDMARKS[angle_joints[2]]
-            
-            # Calculate angles for live and reference
-            live_angle = PoseComparator.calculate_angle(
-                live_landmarks[joint1_idx],
-                live_landmarks[joint2_idx],
-                live_landmarks[joint3_idx]
-            )
-            
-            ref_angle = PoseComparator.calculate_angle(
-                reference_landmarks[joint1_idx],
-                reference_landmarks[joint2_idx],
-                reference_landmarks[joint3_idx]
-            )
-            
-            angle_diff = abs(live_angle - ref_angle)
-            angle_differences.append(angle_diff)
+        # Calculate angles for live and reference in one batch
+        live_points, triplets, live_angles, ref_angles, symmetry_score = \
+            PoseComparator.compare_joint_angles(live_landmarks, reference_landmarks, key_angles)
+        angle_differences = np.abs(live_angles - ref_angles)
+        
+        # Only joints past the error threshold need Python-side work
+        flagged = np.flatnonzero(angle_differences > 10)
+        positions = live_points[triplets[flagged, 1]] * np.asarray(frame_size, dtype=np.float64)
+        for i, (x, y) in zip(flagged, positions.tolist()):
+            joint_name = key_angles[i][1]
+            angle_diff = angle_differences[i]
             
             # Store joint errors for visualization
-            if angle_diff > 10:
-                joint_errors.append({
-                    'joint': angle_joints[1],
-                    'error': angle_diff,
-                    'position': (
-                        live_landmarks[joint2_idx]['x'] * 640,
-                        live_landmarks[joint2_idx]['y'] * 480
-                    )
-                })
-                
-                # Generate specific feedback
-                if angle_diff > 20:
-                    if live_angle > ref_angle:
-                        feedback.append(f"Decrease {angle_joints[1].replace('_', ' ')} angle")
-                    else:
-                        feedback.append(f"Increase {angle_joints[1].replace('_', ' ')} angle")
+            joint_errors.append({
+                'joint': joint_name,
+                'error': float(angle_diff),
+                'position': (x, y)
+            })
+            
+            # Generate specific feedback
+            if angle_diff > 20:
+                if live_angles[i] > ref_angles[i]:
+                    feedback.append(f"Decrease {joint_name.replace('_', ' ')} angle")
+                else:
+                    feedback.append(f"Increase {joint_name.replace('_', ' ')} angle")
         
         # Calculate scores
-        alignment_score = max(0, 100 - np.mean(angle_differences) * 2)
-        symmetry_score = PoseComparator.calculate_symmetry(live_landmarks)
+        alignment_score = max(0, 100 - float(angle_differences.mean()) * 2)
         overall_score = (alignment_score * 0.7 + symmetry_score * 0.3)
         
         # Add pose-specific feedback
-        if pose_mode == "Front Double Biceps":
-            if alignment_score < 70:
-                feedback.append("Raise arms to shoulder level")
-                feedback.append("Flex biceps harder")
-        elif pose_mode == "Side Chest":
-            if alignment_score < 70:
-                feedback.append("Turn torso more to the side")
-                feedback.append("Bring front arm across chest")
-        elif pose_mode == "Back Lat Spread":
-            if alignment_score < 70:
-                feedback.append("Spread lats wider")
-                feedback.append("Keep elbows forward")
-        elif pose_mode == "Rear Double Biceps":
-            if alignment_score < 70:
-                feedback.append("Flex calves")
-                feedback.append("Squeeze shoulder blades together")
+        if alignment_score < 70:
+            feedback.extend(_POSE_ALIGNMENT_TIPS.get(pose_mode, ()))
         
         # Add symmetry feedback
         if symmetry_score < 80:
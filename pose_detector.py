@@ -1,14 +1,40 @@
+import threading
 import cv2
 import mediapipe as mp
 import numpy as np
+from pose_comparator import PoseComparator
+
+# Longest frame edge passed to MediaPipe; larger frames are downscaled first
+MAX_INPUT_EDGE = 640
+
+# Skeleton edges as (start, end) landmark index pairs, resolved once at import
+POSE_CONNECTION_IDX = np.array(sorted(mp.solutions.pose.POSE_CONNECTIONS), dtype=np.intp)
+
+
+def landmark_list_to_array(landmark_list):
+    """
+    Copy a MediaPipe landmark list into a single array in one pass.
+
+    Args:
+        landmark_list: MediaPipe NormalizedLandmarkList
+
+    Returns:
+        (N, 4) float32 array of x, y, z, visibility per landmark
+    """
+    return np.array([(lm.x, lm.y, lm.z, lm.visibility) for lm in landmark_list.landmark],
+                    dtype=np.float32)
 
 
 class PoseDetector:
-    def __init__(self):
+    def __init__(self, max_input_edge=MAX_INPUT_EDGE, static_image_mode=False):
         self.mp_pose = mp.solutions.pose
-        # Optimized settings for smooth camera performance
+        # Frames whose longest edge exceeds this are downscaled before inference
+        self.max_input_edge = max_input_edge
+        # Optimized settings for smooth camera performance. Pass
+        # static_image_mode=True when frames are unrelated still images, so
+        # each one is detected from scratch instead of tracked from the last.
         self.pose = self.mp_pose.Pose(
-            static_image_mode=False,
+            static_image_mode=static_image_mode,
             model_complexity=1,  # Balanced complexity for good performance
             smooth_landmarks=True,
             enable_segmentation=False,
@@ -18,30 +44,43 @@ class PoseDetector:
         )
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
+        # Reused downscale and RGB conversion targets, reallocated only when
+        # the frame size changes
+        self._small_buf = None
+        self._rgb_buf = None
+        self._lock = threading.Lock()
         
     def process_frame(self, frame):
         """Process a frame and extract pose landmarks with optimized performance"""
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # The Pose graph and the reused buffers are shared by every caller,
+        # so analysis threads take turns using them
+        with self._lock:
+            # MediaPipe shrinks its input to the model resolution anyway, so
+            # downscale large frames before converting them. Landmarks are
+            # normalized to the frame, so they need no rescaling afterwards.
+            height, width = frame.shape[:2]
+            scale = self.max_input_edge / max(height, width)
+            if scale < 1:
+                small_shape = (round(height * scale), round(width * scale)) + frame.shape[2:]
+                if self._small_buf is None or self._small_buf.shape != small_shape:
+                    self._small_buf = np.empty(small_shape, dtype=frame.dtype)
+                frame = cv2.resize(frame, small_shape[1::-1], dst=self._small_buf,
+                                   interpolation=cv2.INTER_AREA)
         
-        # To improve performance, we can optionally reduce resolution
-        # Uncomment if experiencing lag:
-        # rgb_frame = cv2.resize(rgb_frame, (640, 480))
+            # Convert BGR to RGB into the reused buffer instead of a fresh array
+            if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+                self._rgb_buf = np.empty_like(frame)
+            self._rgb_buf.flags.writeable = True
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         
+            # MediaPipe references read-only input instead of copying it
+            rgb_frame.flags.writeable = False
 
-        results = self.pose.process(rgb_frame)
+            results = self.pose.process(rgb_frame)
         
         if results.pose_landmarks:
-            landmarks = []
-            for landmark in results.pose_landmarks.landmark:
-                landmarks.append({
-                    'x': landmark.x,
-                    'y': landmark.y,
-                    'z': landmark.z,
-                    'visibility': landmark.visibility
-                })
             return {
-                'landmarks': landmarks,
+                'landmarks': landmark_list_to_array(results.pose_landmarks),
                 'world_landmarks': results.pose_world_landmarks,
                 'pose_detected': True
             }
@@ -53,32 +92,28 @@ class PoseDetector:
         }
     
     def draw_pose(self, frame, landmarks):
-        """Draw pose landmarks on the frame with optimized rendering"""
+        """Draw pose landmarks (array or list of dicts) on the frame with optimized rendering"""
         if landmarks is None:
             return frame
             
-        # Import the proper MediaPipe landmark format
-        from mediapipe.framework.formats import landmark_pb2
+        height, width = frame.shape[:2]
+        landmarks = PoseComparator.landmarks_to_pack(landmarks)
         
-        # Create proper MediaPipe landmark list
-        pose_landmarks = landmark_pb2.NormalizedLandmarkList()
+        # Same rules as mp_drawing.draw_landmarks: skip low-visibility and
+        # off-frame landmarks, and clamp pixel coordinates to the frame
+        xy = landmarks[:, :2]
+        visible = (landmarks[:, 3] >= 0.5) & np.all((xy >= 0) & (xy <= 1), axis=1)
+        points = np.minimum(np.floor(xy * (width, height)),
+                            (width - 1, height - 1)).astype(np.int32)
         
-        # Convert our landmarks to MediaPipe format
-        for lm in landmarks:
-            landmark = pose_landmarks.landmark.add()
-            landmark.x = lm['x']
-            landmark.y = lm['y']
-            landmark.z = lm['z']
-            landmark.visibility = lm['visibility']
+        # Draw every connection between visible landmarks in one call
+        connections = POSE_CONNECTION_IDX[visible[POSE_CONNECTION_IDX].all(axis=1)]
+        cv2.polylines(frame, points[connections], False, (0, 128, 255), 1)
         
-        # Draw the pose with thinner lines for better performance
-        self.mp_drawing.draw_landmarks(
-            frame,
-            pose_landmarks,
-            self.mp_pose.POSE_CONNECTIONS,
-            self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=1, circle_radius=2),
-            self.mp_drawing.DrawingSpec(color=(0, 128, 255), thickness=1, circle_radius=1)
-        )
+        # Landmark dots with a light border, drawn over the lines
+        for x, y in points[visible].tolist():
+            cv2.circle(frame, (x, y), 3, (224, 224, 224), 1)
+            cv2.circle(frame, (x, y), 2, (0, 255, 0), 1)
         
         return frame
     
@@ -117,27 +152,24 @@ class PoseDetector:
         return frame
     
     def get_joint_angle(self, landmarks, joint1_idx, joint2_idx, joint3_idx):
-        """Calculate angle between three joints"""
-        if not landmarks:
-            return None
-
-        try:
-            joint1 = landmarks[joint1_idx]
-            joint2 = landmarks[joint2_idx]
-            joint3 = landmarks[joint3_idx]
-
-            # Calculate vectors
-            v1 = np.array([joint1['x'] - joint2['x'], joint1['y'] - joint2['y']])
-            v2 = np.array([joint3['x'] - joint2['x'], joint3['y'] - joint2['y']])
+        """
+        Calculate the angle at joint2 formed by three joints.
 
-            # Calculate angle
-            cosine_angle = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2) + 1e-6)
-            angle = np.arccos(np.clip(cosine_angle, -1.0, 1.0))
+        Args:
+            landmarks: (33, 4) landmark array from get_landmarks, or a list of
+                landmark dicts with 'x' and 'y' keys
+            joint1_idx, joint2_idx, joint3_idx: Landmark indices, vertex in the middle
 
-            return np.degrees(angle)
-        except:
+        Returns:
+            Angle in degrees (0-180), or None if no landmarks were given
+        """
+        if landmarks is None or len(landmarks) == 0:
             return None
 
+        return PoseComparator.calculate_angle(landmarks[joint1_idx],
+                                              landmarks[joint2_idx],
+                                              landmarks[joint3_idx])
+
     def capture_frame(self):
         """
         Capture a single frame from the camera.
@@ -164,7 +196,7 @@ class PoseDetector:
             image_bgr: BGR image (numpy array)
 
         Returns:
-            List of landmark dicts with x, y, z, visibility keys, or None if no pose detected
+            (33, 4) float32 array of x, y, z, visibility per landmark, or None if no pose detected
         """
         results = self.process_frame(image_bgr)
         return results.get('landmarks', None)
@@ -5,6 +5,21 @@ Quick test script to verify PosePerfect.AI is working correctly
 import sys
 import os
 import cv2
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _detector():
+    """Shared PoseDetector; building the MediaPipe graph is the slowest step"""
+    from pose_detector import PoseDetector
+    return PoseDetector()
+
+
+@lru_cache(maxsize=8)
+def _ref(i):
+    """Decoded reference_poses/pose{i}.jpg, loaded once per run"""
+    return cv2.imread(os.path.join("reference_poses", f"pose{i}.jpg"))
+
 
 def test_imports():
     """Test all required imports"""
@@ -82,15 +97,17 @@ def test_reference_images():
         print(f"[FAIL] Reference poses directory not found")
         return False
     
+    from PIL import Image
+
     for i in range(1, 5):
         pose_file = os.path.join(reference_dir, f"pose{i}.jpg")
         if os.path.exists(pose_file):
-            # Try to load the image
-            img = cv2.imread(pose_file)
-            if img is not None:
-                h, w = img.shape[:2]
+            # Read just the image header for its size instead of decoding it
+            try:
+                with Image.open(pose_file) as img:
+                    w, h = img.size
                 print(f"[OK] pose{i}.jpg loaded successfully ({w}x{h})")
-            else:
+            except OSError:
                 print(f"[FAIL] pose{i}.jpg exists but couldn't be loaded")
                 return False
         else:
@@ -125,11 +142,10 @@ def test_pose_detection():
     print("\nTesting pose detection...")
     
     try:
-        from pose_detector import PoseDetector
-        detector = PoseDetector()
+        detector = _detector()
         
         # Try with first reference image
-        test_img = cv2.imread("reference_poses/pose1.jpg")
+        test_img = _ref(1)
         if test_img is not None:
             results = detector.process_frame(test_img)
             if results['pose_detected']:
@@ -138,7 +154,6 @@ def test_pose_detection():
             else:
                 print("[FAIL] No pose detected in reference image")
             
-            detector.close()
             return results['pose_detected']
         else:
             print("[FAIL] Couldn't load test image")
@@ -176,20 +191,19 @@ def test_compare_pose():
     print("\nTesting compare_pose function...")
 
     try:
-        from pose_detector import PoseDetector
         from pose_comparator import compare_pose
 
-        detector = PoseDetector()
+        detector = _detector()
 
         # Load two reference images
-        img1 = cv2.imread("reference_poses/pose1.jpg")
-        img2 = cv2.imread("reference_poses/pose1.jpg")  # Same image for testing
+        img1 = _ref(1)
+        img2 = _ref(1)  # Same image for testing
 
         if img1 is not None and img2 is not None:
             lm1 = detector.get_landmarks(img1)
             lm2 = detector.get_landmarks(img2)
 
-            if lm1 and lm2:
+            if lm1 is not None and lm2 is not None:
                 result = compare_pose(lm1, lm2)
 
                 # Check that result has expected fields
@@ -206,15 +220,12 @@ def test_compare_pose():
                     else:
                         print(f"[WARN] Score unexpectedly low ({result['score']:.1f}%) for identical images")
 
-                    detector.close()
                     return True
                 else:
                     print("[FAIL] compare_pose missing required fields")
-                    detector.close()
                     return False
             else:
                 print("[FAIL] Could not extract landmarks")
-                detector.close()
                 return False
         else:
             print("[FAIL] Could not load reference images")
@@ -226,6 +237,64 @@ def test_compare_pose():
         return False
 
 
+def test_batched_angles():
+    """Test batched joint angles on landmark sets with known geometry"""
+    print("\nTesting batched joint angles...")
+
+    try:
+        import numpy as np
+        from pose_comparator import PoseComparator
+
+        lm = PoseComparator.POSE_LANDMARKS
+
+        def pose_array(points):
+            """(33, 4) float32 landmark array, like PoseDetector.get_landmarks returns"""
+            arr = np.zeros((33, 4), dtype=np.float32)
+            arr[:, 3] = 1.0
+            for name, (x, y) in points.items():
+                arr[lm[name], :2] = (x, y)
+            return arr
+
+        # Left elbow at a right angle, right arm fully straight, both
+        # shoulders at a right angle between torso and upper arm
+        live = pose_array({
+            'left_shoulder': (0.5, 0.5), 'left_elbow': (0.6, 0.5), 'left_wrist': (0.6, 0.4),
+            'right_shoulder': (0.4, 0.5), 'right_elbow': (0.3, 0.5), 'right_wrist': (0.2, 0.5),
+            'left_hip': (0.5, 0.8), 'right_hip': (0.4, 0.8)
+        })
+        # Degenerate reference: left arm folded back onto the shoulder and the
+        # right wrist on top of the elbow (a zero-length forearm)
+        ref = pose_array({
+            'left_shoulder': (0.5, 0.5), 'left_elbow': (0.6, 0.5), 'left_wrist': (0.5, 0.5),
+            'right_shoulder': (0.4, 0.5), 'right_elbow': (0.3, 0.5), 'right_wrist': (0.3, 0.5),
+            'left_hip': (0.5, 0.8), 'right_hip': (0.4, 0.8)
+        })
+        joints_config = PoseComparator.POSE_KEY_ANGLES['Front Double Biceps']
+        expected_live = [90.0, 180.0, 90.0, 90.0]
+        expected_ref = [0.0, 0.0, 90.0, 90.0]
+
+        def as_dicts(arr):
+            return [{'x': float(x), 'y': float(y)} for x, y in arr[:, :2]]
+
+        # Production passes the float32 array; dict lists are still accepted
+        for label, live_lm, ref_lm in (("array", live, ref),
+                                       ("dict", as_dicts(live), as_dicts(ref))):
+            comparison = PoseComparator.compare_joint_angles(live_lm, ref_lm, joints_config)
+            if not (np.allclose(comparison.live_angles, expected_live, atol=0.01)
+                    and np.allclose(comparison.ref_angles, expected_ref, atol=0.01)):
+                print(f"[FAIL] Batched angles wrong for {label} landmarks: "
+                      f"{comparison.live_angles} / {comparison.ref_angles}")
+                return False
+
+        print("[OK] Batched angles match known right, straight and folded joints")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Batched angle test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_speak_tips():
     """Test speak_tips method"""
     print("\nTesting speak_tips method...")
@@ -253,13 +322,15 @@ def main():
     
     all_tests_passed = True
     
-    # Run tests
-    if not test_imports():
+    # Run tests, keeping each result so later steps don't re-run the checks
+    imports_ok = test_imports()
+    if not imports_ok:
         all_tests_passed = False
         print("\n[WARN] Please install missing dependencies:")
         print("  pip install -r requirements.txt")
     
-    if not test_modules():
+    modules_ok = test_modules()
+    if not modules_ok:
         all_tests_passed = False
         print("\n[WARN] PosePerfect modules not working correctly")
     
@@ -271,12 +342,18 @@ def main():
     if not test_camera():
         print("\n[WARN] Camera not working - app can still analyze reference images")
     
-    if test_imports() and test_modules():
+    if imports_ok and modules_ok:
         test_pose_detection()
         test_compare_pose()
+        test_batched_angles()
         test_speak_tips()
         test_voice()
 
+        # Release the shared detector once, after every test that used it
+        if _detector.cache_info().currsize:
+            _detector().close()
+            _detector.cache_clear()
+
     # Summary
     print("\n" + "=" * 50)
     if all_tests_passed:
@@ -5,20 +5,22 @@ This package contains utility functions for pose analysis, angle calculations,
 and feedback generation for the Taekwondo training application.
 """
 
-from .angle_utils import (
-    calculate_angle_between_points,
-    calculate_slope_angle,
-    calculate_distance,
-    calculate_body_alignment_score,
-    calculate_stance_width_score,
-    calculate_knee_alignment_score,
-    normalize_coordinates
-)
-
-from .feedback_utils import (
-    FeedbackGenerator,
-    generate_session_summary
-)
+import importlib
+
+# Public names and the submodule that defines each. Submodules are imported
+# on first attribute access (PEP 562), so importing one utility module, such
+# as utils.image_overlay, does not pull in the others.
+_SUBMODULE_BY_NAME = {
+    'calculate_angle_between_points': 'angle_utils',
+    'calculate_slope_angle': 'angle_utils',
+    'calculate_distance': 'angle_utils',
+    'calculate_body_alignment_score': 'angle_utils',
+    'calculate_stance_width_score': 'angle_utils',
+    'calculate_knee_alignment_score': 'angle_utils',
+    'normalize_coordinates': 'angle_utils',
+    'FeedbackGenerator': 'feedback_utils',
+    'generate_session_summary': 'feedback_utils'
+}
 
 __all__ = [
     'calculate_angle_between_points',
@@ -30,4 +32,18 @@ __all__ = [
     'normalize_coordinates',
     'FeedbackGenerator',
     'generate_session_summary'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    submodule = _SUBMODULE_BY_NAME.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
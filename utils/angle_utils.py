@@ -2,6 +2,25 @@ import numpy as np
 import math
 from typing import Tuple, List, Dict, Optional
 
+# Key body points returned by normalize_coordinates, with their MediaPipe pose landmark indices
+_KEY_BODY_POINTS = (
+    ('nose', 0),
+    ('left_shoulder', 11),
+    ('right_shoulder', 12),
+    ('left_elbow', 13),
+    ('right_elbow', 14),
+    ('left_wrist', 15),
+    ('right_wrist', 16),
+    ('left_hip', 23),
+    ('right_hip', 24),
+    ('left_knee', 25),
+    ('right_knee', 26),
+    ('left_ankle', 27),
+    ('right_ankle', 28)
+)
+_KEY_BODY_POINT_NAMES = tuple(name for name, _ in _KEY_BODY_POINTS)
+_KEY_BODY_POINT_IDX = np.array([idx for _, idx in _KEY_BODY_POINTS], dtype=np.intp)
+
 def calculate_angle_between_points(point_a: Tuple[float, float], 
                                  point_b: Tuple[float, float], 
                                  point_c: Tuple[float, float]) -> float:
@@ -16,24 +35,15 @@ def calculate_angle_between_points(point_a: Tuple[float, float],
     Returns:
         Angle in degrees (0-180)
     """
-    a = np.array(point_a)
-    b = np.array(point_b)
-    c = np.array(point_c)
-    
     # Create vectors
-    ba = a - b
-    bc = c - b
-    
-    # Calculate angle using dot product
-    cos_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
-    
-    # Clamp to valid range to avoid numerical errors
-    cos_angle = np.clip(cos_angle, -1.0, 1.0)
+    ba_x, ba_y = point_a[0] - point_b[0], point_a[1] - point_b[1]
+    bc_x, bc_y = point_c[0] - point_b[0], point_c[1] - point_b[1]
     
-    angle_rad = np.arccos(cos_angle)
-    angle_deg = np.degrees(angle_rad)
+    # atan2(|cross|, dot) lands in [0, 180] directly, with no clamping needed
+    cross = ba_x * bc_y - ba_y * bc_x
+    dot = ba_x * bc_x + ba_y * bc_y
     
-    return angle_deg
+    return math.degrees(math.atan2(abs(cross), dot))
 
 def calculate_slope_angle(point_a: Tuple[float, float], 
                          point_b: Tuple[float, float]) -> float:
@@ -343,30 +353,20 @@ def normalize_coordinates(landmarks, frame_width: int, frame_height: int) -> Dic
     Normalize landmark coordinates and return key body points
     
     Args:
-        landmarks: MediaPipe pose landmarks
+        landmarks: MediaPipe pose landmarks, or the (33, 4) landmark array
+            returned by PoseDetector
         frame_width: Frame width in pixels
         frame_height: Frame height in pixels
     
     Returns:
         Dictionary of normalized key body points
     """
-    def get_coords(landmark_id):
-        landmark = landmarks.landmark[landmark_id]
-        return (landmark.x * frame_width, landmark.y * frame_height)
+    if isinstance(landmarks, np.ndarray):
+        key_xy = landmarks[_KEY_BODY_POINT_IDX, :2]
+    else:
+        points = landmarks.landmark
+        key_xy = np.array([(points[idx].x, points[idx].y) for idx in _KEY_BODY_POINT_IDX])
     
-    # MediaPipe pose landmark indices
-    return {
-        'nose': get_coords(0),
-        'left_shoulder': get_coords(11),
-        'right_shoulder': get_coords(12),
-        'left_elbow': get_coords(13),
-        'right_elbow': get_coords(14),
-        'left_wrist': get_coords(15),
-        'right_wrist': get_coords(16),
-        'left_hip': get_coords(23),
-        'right_hip': get_coords(24),
-        'left_knee': get_coords(25),
-        'right_knee': get_coords(26),
-        'left_ankle': get_coords(27),
-        'right_ankle': get_coords(28)
-    }
\ No newline at end of file
+    # Scale all key points to pixels in one multiply
+    pixel_xy = key_xy * np.array([frame_width, frame_height], dtype=np.float64)
+    return dict(zip(_KEY_BODY_POINT_NAMES, map(tuple, pixel_xy.tolist())))
@@ -1,4 +1,6 @@
-from typing import Dict, List, Tuple, Optional
+from collections import Counter
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Tuple, Optional
 import random
 from .angle_utils import (
     calculate_angle_between_points,
@@ -8,61 +10,125 @@ from .angle_utils import (
     normalize_coordinates
 )
 
+class MoveFeedback(NamedTuple):
+    """Key aspects and common error corrections for a single move"""
+    key_aspects: Tuple[str, ...]
+    common_errors: Mapping[str, str]
+
+# Feedback templates and per-move data are built once at import time
+_FEEDBACK_TEMPLATES = MappingProxyType({
+    'positive': (
+        "Excellent {aspect}!",
+        "Great {aspect}!",
+        "Perfect {aspect}!",
+        "Outstanding {aspect}!",
+        "Well done with your {aspect}!"
+    ),
+    'improvement': (
+        "Work on your {aspect}",
+        "Focus on improving {aspect}",
+        "Try to enhance your {aspect}",
+        "Pay attention to your {aspect}",
+        "Keep practicing your {aspect}"
+    ),
+    'correction': (
+        "{specific_instruction}",
+        "Remember to {specific_instruction}",
+        "Try to {specific_instruction}",
+        "Focus on {specific_instruction}"
+    )
+})
+
+_RAW_MOVE_FEEDBACK = {
+    'front_stance': {
+        'key_aspects': ['leg positioning', 'weight distribution', 'posture'],
+        'common_errors': {
+            'narrow_stance': "Widen your stance for better stability",
+            'straight_back_leg': "Bend your back leg slightly",
+            'forward_lean': "Keep your torso upright",
+            'uneven_shoulders': "Level your shoulders"
+        }
+    },
+    'horse_stance': {
+        'key_aspects': ['thigh parallel', 'back straight', 'weight distribution'],
+        'common_errors': {
+            'high_stance': "Lower your body, thighs should be parallel to ground",
+            'forward_lean': "Keep your back straight and vertical",
+            'feet_angle': "Point your feet forward, not outward"
+        }
+    },
+    'roundhouse_kick': {
+        'key_aspects': ['knee lift', 'hip rotation', 'balance'],
+        'common_errors': {
+            'low_knee': "Lift your knee higher toward the target",
+            'no_hip_rotation': "Rotate your hips for more power",
+            'poor_balance': "Keep your standing leg stable",
+            'slow_retraction': "Snap your leg back quickly after the kick"
+        }
+    }
+}
+
+# Bind each move to a flat, read-only record so lookups are a single dict access
+_MOVE_SPECIFIC_FEEDBACK = MappingProxyType({
+    move: MoveFeedback(tuple(data['key_aspects']),
+                       MappingProxyType(data['common_errors']))
+    for move, data in _RAW_MOVE_FEEDBACK.items()
+})
+
+# Per-level thresholds, per-aspect corrections and weights, and progression
+# suggestions are fixed, so they are built once rather than on every call
+_LEVEL_THRESHOLDS = MappingProxyType({
+    'beginner': {'good': 60, 'excellent': 80},
+    'intermediate': {'good': 70, 'excellent': 85},
+    'advanced': {'good': 80, 'excellent': 90}
+})
+
+_ASPECT_CORRECTIONS = MappingProxyType({
+    'body_alignment': "Keep your shoulders level and hips square",
+    'stance_width': "Adjust your stance width - check your feet positioning",
+    'left_knee_alignment': "Align your left knee over your ankle",
+    'right_knee_alignment': "Align your right knee over your ankle",
+    'front_leg_straightness': "Keep your front leg straighter",
+    'back_leg_bend': "Bend your back leg more for stability",
+    'knee_lift': "Lift your kicking knee higher",
+    'standing_leg_stability': "Keep your standing leg strong and stable"
+})
+
+_ASPECT_WEIGHTS = MappingProxyType({
+    'body_alignment': 0.25,
+    'stance_width': 0.20,
+    'left_knee_alignment': 0.15,
+    'right_knee_alignment': 0.15,
+    'front_leg_straightness': 0.10,
+    'back_leg_bend': 0.10,
+    'knee_lift': 0.20,
+    'standing_leg_stability': 0.15
+})
+
+_PROGRESSION_SUGGESTIONS = MappingProxyType({
+    'beginner': {
+        'high': "Try practicing horse stance or basic kicks",
+        'medium': "Continue practicing basic stances with focus on form",
+        'low': "Focus on basic posture and body alignment first"
+    },
+    'intermediate': {
+        'high': "Ready for combination techniques and sparring drills",
+        'medium': "Practice advanced stances and kicks",
+        'low': "Return to fundamentals and build consistency"
+    },
+    'advanced': {
+        'high': "Focus on speed, power, and competition techniques",
+        'medium': "Work on technique refinement and teaching others",
+        'low': "Review fundamentals and focus on precision"
+    }
+})
+
 class FeedbackGenerator:
     """Generate contextual feedback for Taekwondo poses"""
     
     def __init__(self):
-        self.feedback_templates = {
-            'positive': [
-                "Excellent {aspect}!",
-                "Great {aspect}!",
-                "Perfect {aspect}!",
-                "Outstanding {aspect}!",
-                "Well done with your {aspect}!"
-            ],
-            'improvement': [
-                "Work on your {aspect}",
-                "Focus on improving {aspect}",
-                "Try to enhance your {aspect}",
-                "Pay attention to your {aspect}",
-                "Keep practicing your {aspect}"
-            ],
-            'correction': [
-                "{specific_instruction}",
-                "Remember to {specific_instruction}",
-                "Try to {specific_instruction}",
-                "Focus on {specific_instruction}"
-            ]
-        }
-        
-        self.move_specific_feedback = {
-            'front_stance': {
-                'key_aspects': ['leg positioning', 'weight distribution', 'posture'],
-                'common_errors': {
-                    'narrow_stance': "Widen your stance for better stability",
-                    'straight_back_leg': "Bend your back leg slightly",
-                    'forward_lean': "Keep your torso upright",
-                    'uneven_shoulders': "Level your shoulders"
-                }
-            },
-            'horse_stance': {
-                'key_aspects': ['thigh parallel', 'back straight', 'weight distribution'],
-                'common_errors': {
-                    'high_stance': "Lower your body, thighs should be parallel to ground",
-                    'forward_lean': "Keep your back straight and vertical",
-                    'feet_angle': "Point your feet forward, not outward"
-                }
-            },
-            'roundhouse_kick': {
-                'key_aspects': ['knee lift', 'hip rotation', 'balance'],
-                'common_errors': {
-                    'low_knee': "Lift your knee higher toward the target",
-                    'no_hip_rotation': "Rotate your hips for more power",
-                    'poor_balance': "Keep your standing leg stable",
-                    'slow_retraction': "Snap your leg back quickly after the kick"
-                }
-            }
-        }
+        self.feedback_templates = _FEEDBACK_TEMPLATES
+        self.move_specific_feedback = _MOVE_SPECIFIC_FEEDBACK
     
     def generate_comprehensive_feedback(self, 
                                       landmarks, 
@@ -233,14 +299,8 @@ class FeedbackGenerator:
         }
         
         # Set thresholds based on user level
-        thresholds = {
-            'beginner': {'good': 60, 'excellent': 80},
-            'intermediate': {'good': 70, 'excellent': 85},
-            'advanced': {'good': 80, 'excellent': 90}
-        }
-        
-        good_threshold = thresholds[user_level]['good']
-        excellent_threshold = thresholds[user_level]['excellent']
+        good_threshold = _LEVEL_THRESHOLDS[user_level]['good']
+        excellent_threshold = _LEVEL_THRESHOLDS[user_level]['excellent']
         
         # Analyze each score
         for aspect, score in scores.items():
@@ -262,18 +322,7 @@ class FeedbackGenerator:
     
     def _get_specific_correction(self, aspect: str, score: float, move_type: str) -> str:
         """Get specific correction for an aspect"""
-        corrections = {
-            'body_alignment': "Keep your shoulders level and hips square",
-            'stance_width': "Adjust your stance width - check your feet positioning",
-            'left_knee_alignment': "Align your left knee over your ankle",
-            'right_knee_alignment': "Align your right knee over your ankle",
-            'front_leg_straightness': "Keep your front leg straighter",
-            'back_leg_bend': "Bend your back leg more for stability",
-            'knee_lift': "Lift your kicking knee higher",
-            'standing_leg_stability': "Keep your standing leg strong and stable"
-        }
-        
-        return corrections.get(aspect, f"Work on improving your {aspect.replace('_', ' ')}")
+        return _ASPECT_CORRECTIONS.get(aspect, f"Work on improving your {aspect.replace('_', ' ')}")
     
     def _analyze_specific_move(self, coords: Dict, move_type: str) -> Dict:
         """Provide move-specific analysis"""
@@ -283,7 +332,7 @@ class FeedbackGenerator:
         move_data = self.move_specific_feedback[move_type]
         analysis = {
             'move_type': move_type,
-            'key_aspects_checked': move_data['key_aspects'],
+            'key_aspects_checked': move_data.key_aspects,
             'specific_observations': []
         }
         
@@ -312,22 +361,11 @@ class FeedbackGenerator:
             return 0
         
         # Weight different aspects
-        weights = {
-            'body_alignment': 0.25,
-            'stance_width': 0.20,
-            'left_knee_alignment': 0.15,
-            'right_knee_alignment': 0.15,
-            'front_leg_straightness': 0.10,
-            'back_leg_bend': 0.10,
-            'knee_lift': 0.20,
-            'standing_leg_stability': 0.15
-        }
-        
         weighted_sum = 0
         total_weight = 0
         
         for aspect, score in scores.items():
-            weight = weights.get(aspect, 0.05)  # Default small weight for unknown aspects
+            weight = _ASPECT_WEIGHTS.get(aspect, 0.05)  # Default small weight for unknown aspects
             weighted_sum += score * weight
             total_weight += weight
         
@@ -350,26 +388,8 @@ class FeedbackGenerator:
         """Suggest next steps for progression"""
         avg_score = sum(scores.values()) / len(scores) if scores else 0
         
-        suggestions = {
-            'beginner': {
-                'high': "Try practicing horse stance or basic kicks",
-                'medium': "Continue practicing basic stances with focus on form",
-                'low': "Focus on basic posture and body alignment first"
-            },
-            'intermediate': {
-                'high': "Ready for combination techniques and sparring drills",
-                'medium': "Practice advanced stances and kicks",
-                'low': "Return to fundamentals and build consistency"
-            },
-            'advanced': {
-                'high': "Focus on speed, power, and competition techniques",
-                'medium': "Work on technique refinement and teaching others",
-                'low': "Review fundamentals and focus on precision"
-            }
-        }
-        
         level_key = 'high' if avg_score >= 80 else 'medium' if avg_score >= 60 else 'low'
-        return suggestions[current_level][level_key]
+        return _PROGRESSION_SUGGESTIONS[current_level][level_key]
 
 def generate_session_summary(session_scores: List[Dict], session_duration: float) -> Dict:
     """Generate comprehensive session summary"""
@@ -396,15 +416,18 @@ def generate_session_summary(session_scores: List[Dict], session_duration: float
         all_corrections.extend(score_data.get('specific_corrections', []))
         all_positives.extend(score_data.get('positive_feedback', []))
     
+    # Tally corrections once; the summary and the next-session focus share it
+    most_common_correction = _most_common_item(all_corrections)
+    
     return {
         'session_duration_minutes': round(session_duration, 1),
         'poses_analyzed': len(session_scores),
         'average_score': round(avg_score, 1),
         'improvement_trend': round(improvement, 1),
         'performance_level': _classify_performance(avg_score),
-        'most_common_correction': _most_common_item(all_corrections),
+        'most_common_correction': most_common_correction,
         'most_common_success': _most_common_item(all_positives),
-        'next_session_focus': _get_next_focus(avg_score, all_corrections)
+        'next_session_focus': _get_next_focus(avg_score, most_common_correction)
     }
 
 def _classify_performance(avg_score: float) -> str:
@@ -423,15 +446,13 @@ def _most_common_item(items: List[str]) -> Optional[str]:
     if not items:
         return None
     
-    from collections import Counter
     return Counter(items).most_common(1)[0][0]
 
-def _get_next_focus(avg_score: float, corrections: List[str]) -> str:
+def _get_next_focus(avg_score: float, most_common_correction: Optional[str]) -> str:
     """Suggest focus for next session"""
     if avg_score >= 80:
         return "Try more advanced techniques and combinations"
-    elif corrections:
-        most_common = _most_common_item(corrections)
-        return f"Focus on: {most_common}"
+    elif most_common_correction is not None:
+        return f"Focus on: {most_common_correction}"
     else:
         return "Continue practicing basic stances and form"
\ No newline at end of file
@@ -1,6 +1,26 @@
 import cv2
 import numpy as np
+from pathlib import Path
 from typing import Dict, List, Tuple
+from pose_comparator import PoseComparator
+
+# Map joint names to landmark indices (MediaPipe pose)
+JOINT_LANDMARK_INDEX = {
+    'left_shoulder': 11, 'right_shoulder': 12,
+    'left_elbow': 13, 'right_elbow': 14,
+    'left_wrist': 15, 'right_wrist': 16,
+    'left_hip': 23, 'right_hip': 24,
+    'left_knee': 25, 'right_knee': 26,
+    'left_ankle': 27, 'right_ankle': 28
+}
+
+# Badge color by issue severity
+SEVERITY_COLORS = {
+    0: (0, 255, 0),    # Green - good
+    1: (0, 255, 255),  # Yellow - minor issue
+    2: (0, 165, 255),  # Orange - moderate issue
+    3: (0, 0, 255)     # Red - major issue
+}
 
 
 def draw_feedback_overlay(image: np.ndarray, per_joint_feedback: Dict) -> np.ndarray:
@@ -16,32 +36,26 @@ def draw_feedback_overlay(image: np.ndarray, per_joint_feedback: Dict) -> np.nda
         Annotated image with feedback overlays
     """
     overlay = image.copy()
-    height, width = image.shape[:2]
-
-    # Define landmark positions (approximate, should be passed from actual landmarks)
-    # For now, we'll just add text overlays
 
-    # Add semi-transparent overlay for text background
-    overlay_bg = image.copy()
+    # Text-only overlay; joint positions are drawn by draw_joint_badges
 
     y_offset = 30
     for joint_name, feedback in per_joint_feedback.items():
         if 'delta_deg' not in feedback:
             continue
 
-        delta = feedback['delta_deg']
-        advice = feedback.get('advice', '')
+        deviation = abs(feedback['delta_deg'])
 
         # Color based on severity
-        if abs(delta) > 15:
+        if deviation > 15:
             color = (0, 0, 255)  # Red for large deviations
-        elif abs(delta) > 10:
+        elif deviation > 10:
             color = (0, 165, 255)  # Orange for moderate
         else:
             color = (0, 255, 255)  # Yellow for small
 
         # Draw text
-        text = f"{joint_name.replace('_', ' ').title()}: {abs(delta):.0f}°"
+        text = f"{joint_name.replace('_', ' ').title()}: {deviation:.0f}°"
         cv2.putText(overlay, text, (10, y_offset),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
         y_offset += 25
@@ -49,13 +63,14 @@ def draw_feedback_overlay(image: np.ndarray, per_joint_feedback: Dict) -> np.nda
     return overlay
 
 
-def draw_joint_badges(image: np.ndarray, landmarks: List, joint_issues: Dict) -> np.ndarray:
+def draw_joint_badges(image: np.ndarray, landmarks: np.ndarray, joint_issues: Dict) -> np.ndarray:
     """
     Draw numbered badges on joints that need attention.
 
     Args:
         image: BGR image
-        landmarks: List of landmark dicts with x, y coordinates
+        landmarks: (N, 4) landmark array from PoseDetector.get_landmarks, or
+            a list of landmark dicts with x, y keys
         joint_issues: Dict mapping joint indices to issue severity (0-3)
 
     Returns:
@@ -63,23 +78,18 @@ def draw_joint_badges(image: np.ndarray, landmarks: List, joint_issues: Dict) ->
     """
     overlay = image.copy()
     height, width = image.shape[:2]
+    landmarks = PoseComparator.landmarks_to_pack(landmarks)
 
     for joint_idx, severity in joint_issues.items():
         if joint_idx >= len(landmarks):
             continue
 
-        lm = landmarks[joint_idx]
-        x = int(lm['x'] * width) if lm['x'] <= 1 else int(lm['x'])
-        y = int(lm['y'] * height) if lm['y'] <= 1 else int(lm['y'])
+        lm_x, lm_y = landmarks[joint_idx][:2]
+        x = int(lm_x * width) if lm_x <= 1 else int(lm_x)
+        y = int(lm_y * height) if lm_y <= 1 else int(lm_y)
 
         # Color based on severity
-        colors = {
-            0: (0, 255, 0),    # Green - good
-            1: (0, 255, 255),  # Yellow - minor issue
-            2: (0, 165, 255),  # Orange - moderate issue
-            3: (0, 0, 255)     # Red - major issue
-        }
-        color = colors.get(severity, (128, 128, 128))
+        color = SEVERITY_COLORS.get(severity, (128, 128, 128))
 
         # Draw circle badge
         cv2.circle(overlay, (x, y), 12, color, -1)
@@ -92,13 +102,14 @@ def draw_joint_badges(image: np.ndarray, landmarks: List, joint_issues: Dict) ->
     return overlay
 
 
-def draw_delta_arrows(image: np.ndarray, landmarks: List, joint_deltas: Dict) -> np.ndarray:
+def draw_delta_arrows(image: np.ndarray, landmarks: np.ndarray, joint_deltas: Dict) -> np.ndarray:
     """
     Draw directional arrows showing how to adjust joints.
 
     Args:
         image: BGR image
-        landmarks: List of landmark dicts
+        landmarks: (N, 4) landmark array from PoseDetector.get_landmarks, or
+            a list of landmark dicts with x, y keys
         joint_deltas: Dict mapping joint names to movement vectors
                      e.g., {"left_elbow": {"direction": "up", "magnitude": 15}}
 
@@ -107,28 +118,19 @@ def draw_delta_arrows(image: np.ndarray, landmarks: List, joint_deltas: Dict) ->
     """
     overlay = image.copy()
     height, width = image.shape[:2]
-
-    # Map joint names to landmark indices (MediaPipe pose)
-    joint_map = {
-        'left_shoulder': 11, 'right_shoulder': 12,
-        'left_elbow': 13, 'right_elbow': 14,
-        'left_wrist': 15, 'right_wrist': 16,
-        'left_hip': 23, 'right_hip': 24,
-        'left_knee': 25, 'right_knee': 26,
-        'left_ankle': 27, 'right_ankle': 28
-    }
+    landmarks = PoseComparator.landmarks_to_pack(landmarks)
 
     for joint_name, delta_info in joint_deltas.items():
-        if joint_name not in joint_map:
+        joint_idx = JOINT_LANDMARK_INDEX.get(joint_name)
+        if joint_idx is None:
             continue
 
-        joint_idx = joint_map[joint_name]
         if joint_idx >= len(landmarks):
             continue
 
-        lm = landmarks[joint_idx]
-        x = int(lm['x'] * width) if lm['x'] <= 1 else int(lm['x'])
-        y = int(lm['y'] * height) if lm['y'] <= 1 else int(lm['y'])
+        lm_x, lm_y = landmarks[joint_idx][:2]
+        x = int(lm_x * width) if lm_x <= 1 else int(lm_x)
+        y = int(lm_y * height) if lm_y <= 1 else int(lm_y)
 
         # Determine arrow direction and endpoint
         direction = delta_info.get('direction', 'up')
@@ -200,9 +202,6 @@ def make_contact_sheet(session_dir, out_path, pose_names: List[str] = None):
         out_path: Output file path for contact sheet
         pose_names: Optional list of pose names for labels
     """
-    import os
-    from pathlib import Path
-
     session_path = Path(session_dir)
 
     # Load all pose images
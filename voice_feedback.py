@@ -1,6 +1,7 @@
 import pyttsx3
 import threading
 import queue
+import random
 import time
 
 
@@ -10,9 +11,10 @@ class VoiceFeedback:
     def __init__(self):
         self.engine = None
         self.feedback_queue = queue.Queue()
-        self.last_feedback_time = 0
+        self.last_feedback_time = float("-inf")
         self.min_feedback_interval = 3.0  # Minimum seconds between feedbacks
         self.is_speaking = False
+        self.base_rate = 135  # Configured speech rate; speak_tips scales from this
         
         # Initialize TTS engine
         self.init_engine()
@@ -36,7 +38,7 @@ class VoiceFeedback:
                         break
             
             # Set speech rate and volume for more natural sound
-            self.engine.setProperty('rate', 135)  # Slower, more natural pace
+            self.engine.setProperty('rate', self.base_rate)  # Slower, more natural pace
             self.engine.setProperty('volume', 0.6)  # Quieter volume (0.0 to 1.0)
             
             print("Voice feedback system initialized successfully")
@@ -48,9 +50,10 @@ class VoiceFeedback:
         """Worker thread for processing feedback queue"""
         while True:
             try:
-                feedback = self.feedback_queue.get(timeout=1)
+                # Block until there is something to say instead of waking every second
+                feedback = self.feedback_queue.get()
                 if feedback and self.engine:
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     
                     # Check if enough time has passed since last feedback
                     if current_time - self.last_feedback_time >= self.min_feedback_interval:
@@ -59,24 +62,26 @@ class VoiceFeedback:
                         self.engine.runAndWait()
                         self.last_feedback_time = current_time
                         self.is_speaking = False
-            except queue.Empty:
-                continue
             except Exception as e:
                 print(f"Error in voice feedback worker: {e}")
                 self.is_speaking = False
     
+    def _clear_queue(self):
+        """Drop any queued feedback that has not been spoken yet"""
+        while True:
+            try:
+                self.feedback_queue.get_nowait()
+            except queue.Empty:
+                return
+    
     def speak(self, text, priority="normal"):
         """Add feedback to the queue"""
         if not self.engine:
             return
 
         # Clear queue for high priority messages
-        if priority == "high" and not self.feedback_queue.empty():
-            while not self.feedback_queue.empty():
-                try:
-                    self.feedback_queue.get_nowait()
-                except queue.Empty:
-                    break
+        if priority == "high":
+            self._clear_queue()
 
         # Add to queue if not currently speaking or high priority
         if not self.is_speaking or priority == "high":
@@ -93,28 +98,18 @@ class VoiceFeedback:
         if not self.engine or not tips:
             return
 
-        # Limit to max 3 tips to avoid overwhelming
-        limited_tips = tips[:3]
+        # Limit to max 3 tips to avoid overwhelming, shortening each to
+        # max 8 words up front so the queueing loop only puts and paces
+        limited_tips = [' '.join(tip.split()[:8]) for tip in tips[:3]]
 
         # Clear existing queue for new batch
-        while not self.feedback_queue.empty():
-            try:
-                self.feedback_queue.get_nowait()
-            except queue.Empty:
-                break
+        self._clear_queue()
 
-        # Set rate
-        original_rate = self.engine.getProperty('rate')
-        adjusted_rate = int(original_rate * rate_scale)
-        self.engine.setProperty('rate', adjusted_rate)
+        # Set rate relative to the configured base so repeated calls don't compound
+        self.engine.setProperty('rate', int(self.base_rate * rate_scale))
 
         # Queue each tip with brief pauses
         for i, tip in enumerate(limited_tips):
-            # Shorten tip if too long (max 8 words)
-            words = tip.split()
-            if len(words) > 8:
-                tip = ' '.join(words[:8])
-
             self.feedback_queue.put(tip)
 
             # Add small pause between tips (except after last)
@@ -143,7 +138,6 @@ class VoiceFeedback:
             "Impressive muscle control!"
         ]
         
-        import random
         self.speak(random.choice(encouragements))
     
     def speak_score(self, score):
@@ -178,33 +172,33 @@ class VoiceFeedback:
 
 # Pose-specific voice cues
 POSE_INSTRUCTIONS = {
-    "Rear Double Biceps": [
+    "Rear Double Biceps": (
         "Face away from the camera",
         "Raise arms like front double biceps",
         "Flex calves by raising on toes",
         "Squeeze shoulder blades together"
-    ],
-    "Front Double Biceps": [
+    ),
+    "Front Double Biceps": (
         "Stand with feet shoulder-width apart",
         "Raise both arms to shoulder level",
         "Flex biceps and rotate wrists outward",
         "Keep chest expanded and abs tight"
-    ],
-    "Side Chest": [
+    ),
+    "Side Chest": (
         "Turn your body to the side",
         "Bring front arm across your chest",
         "Flex the chest and bicep",
         "Keep rear leg slightly bent"
-    ],
-    "Back Lat Spread": [
+    ),
+    "Back Lat Spread": (
         "Face away from the camera",
         "Spread your lats as wide as possible",
         "Keep elbows forward and out",
         "Flex your back muscles"
-    ]
+    )
 }
 
 
 def get_pose_instructions(pose_name):
     """Get voice instructions for a specific pose"""
-    return POSE_INSTRUCTIONS.get(pose_name, ["Position yourself for the pose"])
\ No newline at end of file
+    return POSE_INSTRUCTIONS.get(pose_name, ("Position yourself for the pose",))
\ No newline at end of file